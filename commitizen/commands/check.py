@@ -72,10 +72,11 @@ class Check:
             raise NoCommitsFoundError(f"No commit found with range: '{self.rev_range}'")
 
         pattern = self.cz.schema_pattern()
+        compiled_pattern = re.compile(pattern)
         ill_formated_commits = [
             commit
             for commit in commits
-            if not self.validate_commit_message(commit.message, pattern)
+            if not self.validate_commit_message(commit.message, compiled_pattern)
         ]
         displayed_msgs_content = "\n".join(
             [
@@ -142,7 +143,9 @@ class Check:
                 lines.append(line)
         return "\n".join(lines)
 
-    def validate_commit_message(self, commit_msg: str, pattern: str) -> bool:
+    def validate_commit_message(
+        self, commit_msg: str, pattern: re.Pattern[str]
+    ) -> bool:
         if not commit_msg:
             return self.allow_abort
 
@@ -152,4 +155,4 @@ class Check:
             msg_len = len(commit_msg.partition("\n")[0].strip())
             if msg_len > self.max_msg_length:
                 return False
-        return bool(re.match(pattern, commit_msg))
+        return bool(pattern.match(commit_msg))
@@ -1,26 +1,102 @@
+from __future__ import annotations
+
 import os
 import re
+import sys
+from operator import itemgetter
+from typing import Any
 
 from commitizen import defaults
+from commitizen.config.base_config import BaseConfig
 from commitizen.cz.base import BaseCommitizen
 from commitizen.cz.conventional_commits.translation_multilanguage import (
-    translate_text_from_eng,
+    translate_many,
 )
 from commitizen.cz.utils import multiple_line_breaker, required_validator
 from commitizen.defaults import Questions
 
 __all__ = ["ConventionalCommitsCz"]
 
+_INFO_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "conventional_commits_info.txt"
+)
+
+_SCHEMA_PATTERN = (
+    r"(build|ci|docs|feat|fix|perf|refactor|style|test|chore|revert|bump)"  # type
+    r"(\(\S+\))?!?:"  # scope
+    r"( [^\n\r]+)"  # subject
+    r"((\n\n.*)|(\s*))?$"
+)
+# DOTALL explicitly makes . match new line
+_SCHEMA_RE = re.compile(_SCHEMA_PATTERN, re.DOTALL)
+_WS_RE = re.compile(r"\s+")
+
+_get_answers = itemgetter(
+    "prefix", "scope", "subject", "body", "footer", "is_breaking_change"
+)
+_BREAKING_CHANGE_PREFIX = "BREAKING CHANGE: "
+_PARAGRAPH_SEPARATOR = "\n\n"
+
+_TYPES = frozenset(
+    sys.intern(type_)
+    for type_ in (
+        "build",
+        "ci",
+        "docs",
+        "feat",
+        "fix",
+        "perf",
+        "refactor",
+        "style",
+        "test",
+        "chore",
+        "revert",
+        "bump",
+    )
+)
+
+_TYPE_PREFIXES = tuple(
+    type_ + suffix for type_ in sorted(_TYPES) for suffix in ("(", ":", "!")
+)
+
+_CHOICE_SPECS = (
+    ("fix", "x", "A bug fix. Correlates with PATCH in SemVer", "fix"),
+    ("feat", "f", "A new feature. Correlates with MINOR in SemVer", "feat"),
+    ("docs", "d", "Documentation only changes", "docs"),
+    (
+        "style",
+        "s",
+        """Changes that do not affect the meaning of the code (white-space, formatting,  missing semi-colons, etc)""",
+        "style",
+    ),
+    (
+        "refactor",
+        "r",
+        """A code change that neither fixes a bug nor adds a feature""",
+        "refactor",
+    ),
+    ("perf", "p", "A code change that improves performance", "perf"),
+    ("test", "t", "Adding missing or correcting existing tests", "test"),
+    (
+        "build",
+        "b",
+        """Changes that affect the build system or external dependencies (example scopes: pip, docker, npm)""",
+        "build",
+    ),
+    (
+        "ci",
+        "c",
+        """Changes to CI configuration files and scripts (example scopes: GitLabCI)""",
+        "ci",
+    ),
+)
+
 
 def parse_scope(text):
     if not text:
         return ""
 
-    scope = text.strip().split()
-    if len(scope) == 1:
-        return scope[0]
-
-    return "-".join(scope)
+    return _WS_RE.sub("-", text.strip())
 
 
 def parse_subject(text):
@@ -30,11 +106,85 @@ def parse_subject(text):
     return required_validator(text, msg="Subject is required.")
 
 
+# Language-independent structure of the commit questions. Translated prompts
+# are filled in by `questions()` following `_TRANSLATION_SPEC`.
+_QUESTIONS_TEMPLATE: list[dict[str, Any]] = [
+    {
+        "type": "list",
+        "name": "prefix",
+        "message": None,
+        "choices": [
+            {"value": value, "name": None, "key": key}
+            for value, key, _, _ in _CHOICE_SPECS
+        ],
+    },
+    {
+        "type": "input",
+        "name": "scope",
+        "message": None,
+        "filter": parse_scope,
+    },
+    {
+        "type": "input",
+        "name": "subject",
+        "filter": parse_subject,
+        "message": None,
+    },
+    {
+        "type": "input",
+        "name": "body",
+        "message": (
+            "Provide additional contextual information about the code changes: (press [enter] to skip)\n"
+        ),
+        "filter": multiple_line_breaker,
+    },
+    {
+        "type": "confirm",
+        "message": "Is this a BREAKING CHANGE? Correlates with MAJOR in SemVer",
+        "name": "is_breaking_change",
+        "default": False,
+    },
+    {
+        "type": "input",
+        "name": "footer",
+        "message": (
+            "Footer. Information about Breaking Changes and "
+            "reference issues that this commit closes: (press [enter] to skip)\n"
+        ),
+    },
+]
+
+# (question index, choice index or None for the question message, English
+# text, translation key)
+_TRANSLATION_SPEC: tuple[tuple[int, int | None, str, str], ...] = (
+    (0, None, "Select the type of change you are committing", "prefix"),
+    *(
+        (0, choice_index, text, translation_key)
+        for choice_index, (_, _, text, translation_key) in enumerate(_CHOICE_SPECS)
+    ),
+    (
+        1,
+        None,
+        "What is the scope of this change? (class or file name): (press [enter] to skip)\n",
+        "scope",
+    ),
+    (
+        2,
+        None,
+        "Write a short and imperative summary of the code changes: (lower case and no period)\n",
+        "subject",
+    ),
+)
+
+
 class ConventionalCommitsCz(BaseCommitizen):
+    __slots__ = ("config", "_questions_cache")
+
     bump_pattern = defaults.bump_pattern
     bump_map = defaults.bump_map
     bump_map_major_version_zero = defaults.bump_map_major_version_zero
     commit_parser = r"^((?P<change_type>feat|fix|refactor|perf|BREAKING CHANGE)(?:\((?P<scope>[^()\r\n]*)\)|\()?(?P<breaking>!)?|\w+!):\s(?P<message>.*)?"  # noqa
+    commit_parser_re = re.compile(commit_parser)
     change_type_map = {
         "feat": "Feat",
         "fix": "Fix",
@@ -43,166 +193,51 @@ class ConventionalCommitsCz(BaseCommitizen):
     }
     changelog_pattern = defaults.bump_pattern
 
+    _info_cache: dict[tuple[str, str], str] = {}
+
+    def __init__(self, config: BaseConfig) -> None:
+        super().__init__(config)
+        self._questions_cache: dict[str, Questions] = {}
+
     def questions(self, language: str) -> Questions:
-        questions: Questions = [
-            {
-                "type": "list",
-                "name": "prefix",
-                "message": translate_text_from_eng(
-                    "Select the type of change you are committing", language, "prefix"
-                ),
-                "choices": [
-                    {
-                        "value": "fix",
-                        "name": "fix: "
-                        + translate_text_from_eng(
-                            "A bug fix. Correlates with PATCH in SemVer",
-                            language,
-                            "fix",
-                        ),
-                        "key": "x",
-                    },
-                    {
-                        "value": "feat",
-                        "name": "feat: "
-                        + translate_text_from_eng(
-                            "A new feature. Correlates with MINOR in SemVer",
-                            language,
-                            "feat",
-                        ),
-                        "key": "f",
-                    },
-                    {
-                        "value": "docs",
-                        "name": "docs: "
-                        + translate_text_from_eng(
-                            "Documentation only changes", language, "docs"
-                        ),
-                        "key": "d",
-                    },
-                    {
-                        "value": "style",
-                        "name": "style: "
-                        + translate_text_from_eng(
-                            """Changes that do not affect the meaning of the code (white-space, formatting,  missing semi-colons, etc)""",
-                            language,
-                            "style",
-                        ),
-                        "key": "s",
-                    },
-                    {
-                        "value": "refactor",
-                        "name": "refactor: "
-                        + translate_text_from_eng(
-                            """A code change that neither fixes a bug nor adds a feature""",
-                            language,
-                            "refactor",
-                        ),
-                        "key": "r",
-                    },
-                    {
-                        "value": "perf",
-                        "name": "perf: "
-                        + translate_text_from_eng(
-                            "A code change that improves performance", language, "perf"
-                        ),
-                        "key": "p",
-                    },
-                    {
-                        "value": "test",
-                        "name": "test: "
-                        + translate_text_from_eng(
-                            "Adding missing or correcting existing tests",
-                            language,
-                            "test",
-                        ),
-                        "key": "t",
-                    },
-                    {
-                        "value": "build",
-                        "name": "build: "
-                        + translate_text_from_eng(
-                            """Changes that affect the build system or external dependencies (example scopes: pip, docker, npm)""",
-                            language,
-                            "build",
-                        ),
-                        "key": "b",
-                    },
-                    {
-                        "value": "ci",
-                        "name": "ci: "
-                        + translate_text_from_eng(
-                            """Changes to CI configuration files and scripts (example scopes: GitLabCI)""",
-                            language,
-                            "ci",
-                        ),
-                        "key": "c",
-                    },
-                ],
-            },
-            {
-                "type": "input",
-                "name": "scope",
-                "message": translate_text_from_eng(
-                    "What is the scope of this change? (class or file name): (press [enter] to skip)\n",
-                    language,
-                    "scope",
-                ),
-                "filter": parse_scope,
-            },
-            {
-                "type": "input",
-                "name": "subject",
-                "filter": parse_subject,
-                "message": translate_text_from_eng(
-                    "Write a short and imperative summary of the code changes: (lower case and no period)\n",
-                    language, "subject"),
-            },
-            {
-                "type": "input",
-                "name": "body",
-                "message": (
-                    "Provide additional contextual information about the code changes: (press [enter] to skip)\n"
-                ),
-                "filter": multiple_line_breaker,
-            },
-            {
-                "type": "confirm",
-                "message": "Is this a BREAKING CHANGE? Correlates with MAJOR in SemVer",
-                "name": "is_breaking_change",
-                "default": False,
-            },
-            {
-                "type": "input",
-                "name": "footer",
-                "message": (
-                    "Footer. Information about Breaking Changes and "
-                    "reference issues that this commit closes: (press [enter] to skip)\n"
-                ),
-            },
-        ]
+        if language in self._questions_cache:
+            return self._questions_cache[language]
+
+        translations = translate_many(
+            [(text, key) for _, _, text, key in _TRANSLATION_SPEC], language
+        )
+
+        questions = []
+        for question in _QUESTIONS_TEMPLATE:
+            question = question.copy()
+            if "choices" in question:
+                question["choices"] = [choice.copy() for choice in question["choices"]]
+            questions.append(question)
+
+        for (question_index, choice_index, _, _), translation in zip(
+            _TRANSLATION_SPEC, translations
+        ):
+            question = questions[question_index]
+            if choice_index is None:
+                question["message"] = translation
+            else:
+                choice = question["choices"][choice_index]
+                choice["name"] = f"{choice['value']}: {translation}"
+
+        self._questions_cache[language] = questions
         return questions
 
     def message(self, answers: dict) -> str:
-        prefix = answers["prefix"]
-        scope = answers["scope"]
-        subject = answers["subject"]
-        body = answers["body"]
-        footer = answers["footer"]
-        is_breaking_change = answers["is_breaking_change"]
-
-        if scope:
-            scope = f"({scope})"
-        if body:
-            body = f"\n\n{body}"
+        prefix, scope, subject, body, footer, is_breaking_change = _get_answers(answers)
+
         if is_breaking_change:
-            footer = f"BREAKING CHANGE: {footer}"
-        if footer:
-            footer = f"\n\n{footer}"
+            footer = _BREAKING_CHANGE_PREFIX + footer
 
-        message = f"{prefix}{scope}: {subject}{body}{footer}"
+        scope_part = f"({scope})" if scope else ""
+        body_part = _PARAGRAPH_SEPARATOR + body if body else ""
+        footer_part = _PARAGRAPH_SEPARATOR + footer if footer else ""
 
-        return message
+        return f"{prefix}{scope_part}: {subject}{body_part}{footer_part}"
 
     def example(self) -> str:
         return (
@@ -223,25 +258,49 @@ class ConventionalCommitsCz(BaseCommitizen):
         )
 
     def schema_pattern(self) -> str:
-        PATTERN = (
-            r"(?s)"  # To explicitly make . match new line
-            r"(build|ci|docs|feat|fix|perf|refactor|style|test|chore|revert|bump)"  # type
-            r"(\(\S+\))?!?:"  # scope
-            r"( [^\n\r]+)"  # subject
-            r"((\n\n.*)|(\s*))?$"
-        )
-        return PATTERN
+        # `cz check` matches this string without flags, so keep DOTALL inline
+        return f"(?s){_SCHEMA_RE.pattern}"
 
     def info(self) -> str:
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        filepath = os.path.join(dir_path, "conventional_commits_info.txt")
-        with open(filepath, encoding=self.config.settings["encoding"]) as f:
-            content = f.read()
-        return content
+        key = (_INFO_PATH, self.config.settings["encoding"])
+        if key not in self._info_cache:
+            with open(_INFO_PATH, encoding=key[1]) as f:
+                self._info_cache[key] = f.read()
+        return self._info_cache[key]
 
     def process_commit(self, commit: str) -> str:
-        pat = re.compile(self.schema_pattern())
-        m = re.match(pat, commit)
-        if m is None:
+        # Hand-rolled equivalent of matching `_SCHEMA_RE` and taking the
+        # subject group: `<type>(<scope>)!: <subject>`, followed by nothing but
+        # whitespace or by a blank line and the body. It runs in linear time
+        # and never backtracks, whatever the commit message looks like.
+        if not commit.startswith(_TYPE_PREFIXES):
+            # Merge commits, reverts made by git and the like bail out here
+            return ""
+
+        colon = commit.find(": ")
+        if colon == -1:
+            return ""
+
+        head = commit[:colon]
+        if head.endswith("!"):
+            head = head[:-1]
+        if head.endswith(")"):
+            head, _, scope = head[:-1].partition("(")
+            if not scope or any(char.isspace() for char in scope):
+                return ""
+        if head not in _TYPES:
+            return ""
+
+        rest = commit[colon + 2 :]
+        end = len(rest)
+        for line_break in ("\n", "\r"):
+            index = rest.find(line_break, 0, end)
+            if index != -1:
+                end = index
+        if end == 0:
+            return ""
+
+        tail = rest[end:]
+        if tail and not tail.startswith("\n\n") and not tail.isspace():
             return ""
-        return m.group(3).strip()
+        return rest[:end].strip()
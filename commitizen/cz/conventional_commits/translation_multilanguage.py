@@ -1,3 +1,5 @@
+import functools
+
 from translate import Translator
 
 FILENAME = "commitizen/cz/conventional_commits/.cache_multilanguage.txt"
@@ -28,6 +30,7 @@ def translate_text(text, from_lang, to_lang):
     translation = translator.translate(text)
     return translation
 
+@functools.lru_cache(maxsize=1024)
 def translate_text_from_eng(text, to_lang, key):
     global MULTILANGUAGE
     key_generated = generate_key(key, to_lang)
@@ -43,3 +46,6 @@ def translate_text_from_eng(text, to_lang, key):
         MULTILANGUAGE[key_generated] = translate_text(text, "en", to_lang)
         save_multilanguage(key_generated, MULTILANGUAGE[key_generated])
         return MULTILANGUAGE[key_generated]
+
+def translate_many(items, to_lang):
+    return [translate_text_from_eng(text, to_lang, key) for text, key in items]
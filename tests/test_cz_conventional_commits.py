@@ -1,6 +1,10 @@
 import pytest
+from pytest_mock import MockFixture
 
+from commitizen.cz.conventional_commits import translation_multilanguage
 from commitizen.cz.conventional_commits.conventional_commits import (
+    _QUESTIONS_TEMPLATE,
+    _SCHEMA_RE,
     ConventionalCommitsCz,
     parse_scope,
     parse_subject,
@@ -13,7 +17,11 @@ scopes_transformations = [["with spaces", "with-spaces"], [None, ""]]
 
 valid_subjects = ["this is a normal text", "aword"]
 
-subjects_transformations = [["with dot.", "with dot"]]
+subjects_transformations = [
+    ["with dot.", "with dot"],
+    ["with dots...", "with dots"],
+    [".leading dot", "leading dot"],
+]
 
 invalid_subjects = ["", "   ", ".", "   .", "", None]
 
@@ -111,6 +119,20 @@ def test_breaking_change_in_footer(config):
     )
 
 
+def test_breaking_change_without_footer(config):
+    conventional_commits = ConventionalCommitsCz(config)
+    answers = {
+        "prefix": "fix",
+        "scope": "",
+        "subject": "email pattern corrected",
+        "is_breaking_change": True,
+        "body": "",
+        "footer": "",
+    }
+    message = conventional_commits.message(answers)
+    assert message == "fix: email pattern corrected\n\nBREAKING CHANGE: "
+
+
 def test_example(config):
     """just testing a string is returned. not the content"""
     conventional_commits = ConventionalCommitsCz(config)
@@ -147,9 +169,97 @@ def test_info(config):
             "test!(test_scope): this is test msg",
             "",
         ),
+        (
+            "feat(scope:with:colons): this is test msg\n\nwith a body",
+            "this is test msg",
+        ),
+        (
+            "fix: this is test msg\nwithout a blank line",
+            "",
+        ),
+        (
+            "fixup: this is test msg",
+            "",
+        ),
+        (
+            "Merge branch 'master' into feature",
+            "",
+        ),
     ],
 )
 def test_process_commit(commit_message, expected_message, config):
     conventional_commits = ConventionalCommitsCz(config)
     message = conventional_commits.process_commit(commit_message)
     assert message == expected_message
+
+    m = _SCHEMA_RE.match(commit_message)
+    assert message == (m.group(3).strip() if m else "")
+
+
+def test_commit_parser_re_matches_commit_parser():
+    assert (
+        ConventionalCommitsCz.commit_parser_re.pattern
+        == ConventionalCommitsCz.commit_parser
+    )
+    m = ConventionalCommitsCz.commit_parser_re.match("feat(users): add email")
+    assert m is not None
+    assert m.group("change_type") == "feat"
+    assert m.group("scope") == "users"
+    assert m.group("message") == "add email"
+
+
+def test_questions_are_cached_per_language(config, mocker: MockFixture):
+    translate_many_mock = mocker.patch(
+        "commitizen.cz.conventional_commits.conventional_commits.translate_many",
+        side_effect=lambda items, language: [text for text, _ in items],
+    )
+    conventional_commits = ConventionalCommitsCz(config)
+    questions = conventional_commits.questions("en")
+    assert conventional_commits.questions("en") is questions
+    translate_many_mock.assert_called_once()
+
+
+def test_questions_reuse_memoized_translations(config, mocker: MockFixture, tmp_path):
+    cache_file = tmp_path / ".cache_multilanguage.txt"
+    cache_file.write_text("")
+    mocker.patch.object(translation_multilanguage, "FILENAME", str(cache_file))
+    mocker.patch.object(translation_multilanguage, "MULTILANGUAGE", {})
+    translate_text_mock = mocker.patch.object(
+        translation_multilanguage,
+        "translate_text",
+        side_effect=lambda text, from_lang, to_lang: f"[{to_lang}] {text}",
+    )
+    translation_multilanguage.translate_text_from_eng.cache_clear()
+    try:
+        ConventionalCommitsCz(config).questions("fr")
+        ConventionalCommitsCz(config).questions("fr")
+        cache_info = translation_multilanguage.translate_text_from_eng.cache_info()
+    finally:
+        translation_multilanguage.translate_text_from_eng.cache_clear()
+
+    assert translate_text_mock.call_count == 12
+    assert cache_info.misses == 12
+    assert cache_info.hits == 12
+    assert len(cache_file.read_text().splitlines()) == 12
+
+
+def test_questions_fill_translations_without_touching_template(
+    config, mocker: MockFixture
+):
+    mocker.patch(
+        "commitizen.cz.conventional_commits.conventional_commits.translate_many",
+        side_effect=lambda items, language: [f"[{language}]" for _ in items],
+    )
+    conventional_commits = ConventionalCommitsCz(config)
+    questions = conventional_commits.questions("fr")
+
+    assert questions[0]["message"] == "[fr]"
+    assert questions[0]["choices"][0] == {
+        "value": "fix",
+        "name": "fix: [fr]",
+        "key": "x",
+    }
+    assert questions[1]["message"] == "[fr]"
+    assert questions[2]["message"] == "[fr]"
+    assert _QUESTIONS_TEMPLATE[0]["message"] is None
+    assert _QUESTIONS_TEMPLATE[0]["choices"][0]["name"] is None